@@ -12,9 +12,12 @@ def search_text_in_files(folder_path, keyword):
                 file_path = os.path.join(root, file)
                 try:
                     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        for i, line in enumerate(f, 1):
-                            if keyword in line:
-                                results.append((file, i, line.strip()))
+                        data = f.read()
+                    if keyword not in data:
+                        continue
+                    for i, line in enumerate(data.split('\n'), 1):
+                        if keyword in line:
+                            results.append((file, i, line.strip()))
                 except Exception as e:
                     print(f"Error reading {file_path}: {e}")
     return results
@@ -79,8 +82,9 @@ class TextSearchApp:
         self.result_area.delete(1.0, tk.END)
         self.results = search_text_in_files(folder, keyword)
 
-        for file, line_num, line in self.results:
-            self.result_area.insert(tk.END, f"{file} (Line {line_num}): {line}\n")
+        lines = ['%s (Line %d): %s' % row for row in self.results]
+        if lines:
+            self.result_area.insert(tk.END, '\n'.join(lines) + '\n')
 
         self.export_button.config(state=tk.NORMAL if self.results else tk.DISABLED)
 
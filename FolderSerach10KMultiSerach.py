@@ -1,9 +1,96 @@
 import os
 import csv
+import functools
+import queue
 import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 
+PREVIEW_LIMIT = 10000
+FILE_QUEUE_SIZE = 1000
+EXTENSIONS = ('.txt', '.log', '.csv', '.json', '.prn', '.jrn')
+
+
+def _walk_files(folder, accept):
+    # Top-down scandir walk in os.walk order; yields (path, name) straight from the dirent.
+    stack = [folder]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                subdirs = []
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif accept(entry.name):
+                        yield entry.path, entry.name
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_keywords(keywords):
+    # A keyword that contains a shorter keyword can never add a match, so drop it.
+    needles = []
+    for keyword in sorted(set(keywords), key=len):
+        if not any(n in keyword for n in needles):
+            needles.append(keyword)
+    return tuple(needles)
+
+
+def _scan_buffer(data, needles):
+    # Locate every needle with str.find over the whole buffer (C-level scan),
+    # then resolve line numbers in one forward pass over the sorted hits.
+    spans = set()
+    for needle in needles:
+        pos = data.find(needle)
+        while pos != -1:
+            start = data.rfind('\n', 0, pos) + 1
+            end = data.find('\n', pos)
+            if end == -1:
+                end = len(data)
+            spans.add((start, end))
+            pos = data.find(needle, end)
+
+    hits = []
+    line_no, last = 1, 0
+    for start, end in sorted(spans):
+        line_no += data.count('\n', last, start)
+        last = start
+        hits.append((line_no, start, end))
+    return hits
+
+
+def _is_search_file(name):
+    return name.lower().endswith(EXTENSIONS)
+
+
+def _put(q, item, stop_flag):
+    while not stop_flag.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _drain(q, stop_flag):
+    # Consume (path, name) items until the producer's None sentinel or a cancel.
+    while not stop_flag.is_set():
+        try:
+            item = q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if item is None:
+            return
+        yield item
+
 
 class TextSearchApp:
     def __init__(self, master):
@@ -11,6 +98,12 @@ class TextSearchApp:
         master.title("Text Search in Folder (Multi-keyword, Cancel, CSV)")
         master.geometry("820x640")
 
+        menubar = tk.Menu(master)
+        tools_menu = tk.Menu(menubar, tearoff=0)
+        tools_menu.add_command(label="Clear Keyword Cache", command=_compile_keywords.cache_clear)
+        menubar.add_cascade(label="Tools", menu=tools_menu)
+        master.config(menu=menubar)
+
         # Folder selection
         tk.Label(master, text="Folder:").grid(row=0, column=0, sticky='w', padx=5, pady=5)
         self.folder_entry = tk.Entry(master, width=60)
@@ -40,11 +133,21 @@ class TextSearchApp:
         self.export_btn = tk.Button(master, text="Export to CSV", command=self.export_csv, state=tk.DISABLED)
         self.export_btn.grid(row=3, column=2, sticky="e", padx=10)
 
+        # Streaming option
+        self.stream_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(master, text="Stream matches to CSV while searching",
+                       variable=self.stream_var).grid(row=4, column=0, columnspan=3, sticky="w", padx=10)
+
         # Result display
         self.result_area = scrolledtext.ScrolledText(master, width=100, height=30)
-        self.result_area.grid(row=4, column=0, columnspan=3, padx=10, pady=10)
+        self.result_area.grid(row=5, column=0, columnspan=3, padx=10, pady=10)
 
         self.results = []
+        self.match_count = 0
+        self.total_files = None
+        self.progress_determinate = True
+        self.stream_file = None
+        self.stream_writer = None
         self.stop_flag = threading.Event()
 
     def browse_folder(self):
@@ -54,6 +157,9 @@ class TextSearchApp:
             self.folder_entry.insert(0, folder)
 
     def start_search_thread(self):
+        if self.stream_var.get() and not self.open_stream():
+            return
+
         self.stop_flag.clear()
         self.search_btn.config(state=tk.DISABLED)
         self.cancel_btn.config(state=tk.NORMAL)
@@ -61,15 +167,68 @@ class TextSearchApp:
         self.result_area.delete(1.0, tk.END)
         self.status_label.config(text="Status: Searching...")
         self.progress["value"] = 0
-        self.results.clear()
+        self.results = []
+        self.match_count = 0
 
-        thread = threading.Thread(target=self.search_files)
+        thread = threading.Thread(target=self.run_search)
         thread.start()
 
+    def open_stream(self):
+        path = filedialog.asksaveasfilename(defaultextension=".csv",
+                                            filetypes=[("CSV Files", "*.csv")])
+        if not path:
+            return False
+        try:
+            self.stream_file = open(path, 'w', newline='', encoding='utf-8', buffering=1024 * 1024)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open CSV:\n{e}")
+            return False
+        self.stream_writer = csv.writer(self.stream_file)
+        self.stream_writer.writerow(["Filename", "Line Number", "Line"])
+        return True
+
+    def run_search(self):
+        try:
+            self.search_files()
+        finally:
+            if self.stream_file is not None:
+                self.stream_file.close()
+                self.stream_file = None
+                self.stream_writer = None
+
+    def add_result(self, row):
+        if self.stream_writer is not None:
+            self.stream_writer.writerow(row)
+        # Streamed rows live in the CSV; keep only the first PREVIEW_LIMIT for display
+        if self.stream_writer is None or len(self.results) < PREVIEW_LIMIT:
+            self.results.append(row)
+        self.match_count += 1
+
     def cancel_search(self):
         self.stop_flag.set()
         self.status_label.config(text="Status: Cancelling...")
 
+    def enumerate_files(self, folder, file_queue):
+        count = 0
+        for item in _walk_files(folder, _is_search_file):
+            if not _put(file_queue, item, self.stop_flag):
+                return
+            count += 1
+        self.total_files = count
+        _put(file_queue, None, self.stop_flag)
+
+    def update_progress(self, scanned):
+        # Track the mode ourselves: ttk's cget("mode") is a Tcl_Obj, never equal to a str
+        if not self.progress_determinate:
+            if self.total_files is None:
+                self.status_label.config(text=f"Scanning: {scanned} files (listing folder...)")
+                return
+            self.progress.stop()
+            self.progress.config(mode="determinate", maximum=self.total_files)
+            self.progress_determinate = True
+        self.progress["value"] = scanned
+        self.status_label.config(text=f"Scanning: {scanned}/{self.total_files} files")
+
     def search_files(self):
         folder = self.folder_entry.get()
         raw_keywords = self.keyword_entry.get().strip()
@@ -86,46 +245,57 @@ class TextSearchApp:
             self.search_btn.config(state=tk.NORMAL)
             self.cancel_btn.config(state=tk.DISABLED)
             return
+        needles = _compile_keywords(tuple(sorted(keywords)))
 
-        file_list = []
-        for root, _, files in os.walk(folder):
-            for file in files:
-                if file.lower().endswith(('.txt', '.log', '.csv', '.json', '.prn', '.jrn')):
-                    file_list.append(os.path.join(root, file))
-
-        total_files = len(file_list)
-        self.progress["maximum"] = total_files
+        self.total_files = None
+        file_queue = queue.Queue(maxsize=FILE_QUEUE_SIZE)
+        self.progress.config(mode="indeterminate")
+        self.progress_determinate = False
+        self.progress.start(10)
+        threading.Thread(target=self.enumerate_files, args=(folder, file_queue), daemon=True).start()
 
-        for index, file_path in enumerate(file_list, 1):
+        scanned = 0
+        for scanned, (file_path, filename) in enumerate(_drain(file_queue, self.stop_flag), 1):
             if self.stop_flag.is_set():
-                self.status_label.config(text="Status: Search cancelled.")
                 break
 
-            filename = os.path.basename(file_path)
             try:
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for i, line in enumerate(f, 1):
-                        if any(keyword in line.lower() for keyword in keywords):
-                            self.results.append((filename, i, line.strip()))
+                    text = f.read()
+                lowered = text.lower()
+                hits = _scan_buffer(lowered, needles)
+                if hits and len(lowered) != len(text):
+                    # lower() changed the length, so offsets no longer map onto text
+                    lines = text.split('\n')
+                    for i, _, _ in hits:
+                        self.add_result((filename, i, lines[i - 1]))
+                else:
+                    for i, start, end in hits:
+                        self.add_result((filename, i, text[start:end]))
             except Exception as e:
-                self.results.append((filename, 0, f"[Error: {str(e)}]"))
+                self.add_result((filename, 0, f"[Error: {str(e)}]"))
 
-            self.progress["value"] = index
-            self.status_label.config(text=f"Scanning: {index}/{total_files} files")
+            self.update_progress(scanned)
             self.master.update_idletasks()
 
-        if not self.stop_flag.is_set():
-            self.status_label.config(text=f"Completed: {len(self.results)} matches in {total_files} files")
+        self.progress.stop()
+        self.progress.config(mode="determinate", maximum=max(scanned, 1), value=scanned)
+        if self.stop_flag.is_set():
+            self.status_label.config(text="Status: Search cancelled.")
+        else:
+            self.status_label.config(text=f"Completed: {self.match_count} matches in {scanned} files")
 
         self.show_results()
         self.search_btn.config(state=tk.NORMAL)
         self.cancel_btn.config(state=tk.DISABLED)
-        self.export_btn.config(state=tk.NORMAL if self.results else tk.DISABLED)
+        self.export_btn.config(state=tk.NORMAL if self.results and self.stream_writer is None
+                               else tk.DISABLED)
 
     def show_results(self):
         self.result_area.delete(1.0, tk.END)
-        for file, line_num, line in self.results:
-            self.result_area.insert(tk.END, f"{file} (Line {line_num}): {line}\n")
+        lines = ['%s (Line %d): %s' % row for row in self.results]
+        if lines:
+            self.result_area.insert(tk.END, '\n'.join(lines) + '\n')
         self.result_area.yview_moveto(0)
 
     def export_csv(self):
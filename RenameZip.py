@@ -4,6 +4,26 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import threading
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import freeze_support
+
+# Entries at least this large (compressed) are inflated in a worker process
+PARALLEL_MIN_SIZE = 8 * 1024 * 1024
+
+_worker_zip = None
+
+
+def _extract_entry(zip_path, entry_name, dest_path):
+    # Runs in a pool process; keep the archive open across entries of the same ZIP
+    global _worker_zip
+    if _worker_zip is None or _worker_zip.filename != zip_path:
+        if _worker_zip is not None:
+            _worker_zip.close()
+        _worker_zip = zipfile.ZipFile(zip_path, 'r')
+    with _worker_zip.open(entry_name, 'r') as source, open(dest_path, 'wb') as target:
+        shutil.copyfileobj(source, target, length=1024 * 1024)
+    return entry_name
+
 
 class ZipRenameExtractor:
     def __init__(self, master):
@@ -54,7 +74,9 @@ class ZipRenameExtractor:
             messagebox.showerror("Error", "Please select valid folders.")
             return
 
-        zip_files = [f for f in os.listdir(zip_folder) if f.lower().endswith('.zip')]
+        with os.scandir(zip_folder) as it:
+            zip_files = [e for e in it
+                         if e.name.lower().endswith('.zip') and e.is_file(follow_symlinks=False)]
         if not zip_files:
             messagebox.showinfo("Info", "No ZIP files found.")
             return
@@ -62,37 +84,56 @@ class ZipRenameExtractor:
         self.progress["maximum"] = len(zip_files)
         self.progress["value"] = 0
 
-        for i, zip_name in enumerate(zip_files, 1):
-            zip_path = os.path.join(zip_folder, zip_name)
-            zip_prefix = os.path.splitext(zip_name)[0]
-
-            try:
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    for file_info in zip_ref.infolist():
-                        if file_info.is_dir():
-                            continue
-                        original_name = os.path.basename(file_info.filename)
-                        if not original_name:
-                            continue
-
-                        new_name = f"{zip_prefix}_{original_name}"
-                        dest_path = os.path.join(output_folder, new_name)
-
-                        # Create subfolder structure if needed
-                        with zip_ref.open(file_info, 'r') as source, open(dest_path, 'wb') as target:
-                            shutil.copyfileobj(source, target, length=1024 * 1024)  # Copy in 1MB chunks
-
-                self.status_label.config(text=f"Extracted: {zip_name}")
-            except Exception as e:
-                self.status_label.config(text=f"Error: {zip_name} - {e}")
-
-            self.progress["value"] = i
-            self.master.update_idletasks()
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for i, entry in enumerate(zip_files, 1):
+                zip_name = entry.name
+                zip_path = entry.path
+                zip_prefix = os.path.splitext(zip_name)[0]
+
+                try:
+                    jobs = []
+                    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                        # Entries sharing a basename map to one file; keep only the last, as a
+                        # sequential extract would, so two writers never target the same path
+                        targets = {}
+                        for file_info in zip_ref.infolist():
+                            if file_info.is_dir():
+                                continue
+                            original_name = os.path.basename(file_info.filename)
+                            if not original_name:
+                                continue
+
+                            new_name = f"{zip_prefix}_{original_name}"
+                            dest_path = os.path.join(output_folder, new_name)
+                            targets.pop(dest_path, None)
+                            targets[dest_path] = file_info
+
+                        for dest_path, file_info in targets.items():
+                            # Large deflated entries are CPU-bound; inflate them across cores
+                            if (file_info.compress_type != zipfile.ZIP_STORED
+                                    and file_info.compress_size >= PARALLEL_MIN_SIZE):
+                                jobs.append(pool.submit(_extract_entry, zip_path, file_info.filename, dest_path))
+                                continue
+
+                            with zip_ref.open(file_info, 'r') as source, open(dest_path, 'wb') as target:
+                                shutil.copyfileobj(source, target, length=1024 * 1024)  # Copy in 1MB chunks
+
+                    for done, job in enumerate(as_completed(jobs), 1):
+                        job.result()
+                        self.status_label.config(text=f"Extracting: {zip_name} ({done}/{len(jobs)} large files)")
+
+                    self.status_label.config(text=f"Extracted: {zip_name}")
+                except Exception as e:
+                    self.status_label.config(text=f"Error: {zip_name} - {e}")
+
+                self.progress["value"] = i
+                self.master.update_idletasks()
 
         self.status_label.config(text="Status: Done")
         messagebox.showinfo("Done", "All ZIP files extracted and renamed.")
 
 if __name__ == "__main__":
+    freeze_support()
     root = tk.Tk()
     app = ZipRenameExtractor(root)
     root.mainloop()
@@ -1,13 +1,15 @@
 import os
+import sys
 import zipfile
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import threading
-import shutil
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import tempfile
 import re
-from datetime import datetime
-import unicodedata  # for Thai/locale digits
+import functools
+import heapq
 
 # --- Optional 7z support ---
 try:
@@ -17,10 +19,21 @@ except Exception:
     PY7ZR_AVAILABLE = False
 
 INVALID_WIN_CHARS = r'[<>:"/\\|?*\x00-\x1F]'
-
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+SEVENZIP_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+SEVENZIP_BLOCKSIZE = 1024 * 1024
+CANCEL_POLL_MASK = 63  # poll the cancel flag every 64 members
+UI_TICK_MS = 50  # worker UI requests are applied in batches, ~20 times per second
+COPY_BUFSIZE = 4 * 1024 * 1024  # fewer read/write round trips per member than 1 MiB
+
+_INVALID_RE = re.compile(INVALID_WIN_CHARS)
+# Thai, Arabic-Indic, Extended Arabic-Indic, Devanagari and Bengali digits -> ASCII
+_DIGIT_TRANS = str.maketrans({chr(cp + i): str(i)
+                              for cp in (0x0E50, 0x0660, 0x06F0, 0x0966, 0x09E6) for i in range(10)})
+
+@functools.lru_cache(maxsize=1 << 16)
 def sanitize_filename(name: str) -> str:
-    name = re.sub(INVALID_WIN_CHARS, "_", name).strip().rstrip(". ")
-    return name or "unnamed"
+    return _INVALID_RE.sub("_", name).strip().rstrip(". ") or "unnamed"
 
 def unique_path(base_path: str) -> str:
     if not os.path.exists(base_path):
@@ -33,6 +46,42 @@ def unique_path(base_path: str) -> str:
             return candidate
         i += 1
 
+def _dir_prefix(folder: str) -> str:
+    # folder + separator, so per-file paths are a plain concatenation instead of os.path.join
+    return folder if folder.endswith(("/", os.sep)) else folder + os.sep
+
+def _copy(src, dst):
+    # ZipExtFile has no native readinto (the io fallback is read() + memcpy), so a
+    # reusable buffer would add a copy; read1 hands zlib's output straight to write.
+    while chunk := src.read1(1024 * 1024):
+        dst.write(chunk)
+
+def _open_7z(arc_path):
+    # Larger decoder reads amortize per-call overhead; releases before the
+    # blocksize keyword (which read 32 KiB at a time) get the library default
+    try:
+        return py7zr.SevenZipFile(arc_path, mode='r', blocksize=SEVENZIP_BLOCKSIZE)  # type: ignore
+    except TypeError:
+        return py7zr.SevenZipFile(arc_path, mode='r')  # type: ignore
+
+def _7z_extract_targets(arc_path, path, targets):
+    # Each worker needs its own handle; a SevenZipFile is not safe to share across threads
+    with _open_7z(arc_path) as zf:
+        zf.extract(path=path, targets=targets)
+
+def _balance_by_size(infos, n):
+    # Greedy bin packing of entry names into n buckets of similar compressed size
+    buckets = [(0, i, []) for i in range(n)]
+    for fi in sorted(infos, key=lambda fi: fi.compressed or fi.uncompressed or 0, reverse=True):
+        load, i, names = heapq.heappop(buckets)
+        names.append(fi.filename)
+        heapq.heappush(buckets, (load + (fi.compressed or fi.uncompressed or 0), i, names))
+    return [names for _, _, names in buckets if names]
+
+def _7z_mtime(fi) -> float:
+    t = fi.creationtime  # py7zr reports the entry's last-write time here
+    return t.timestamp() if t else 0
+
 class ZipRenameExtractor:
     def __init__(self, master):
         self.master = master
@@ -58,6 +107,11 @@ class ZipRenameExtractor:
         self.limit_entry = tk.Entry(limit_frame, width=10)
         self.limit_entry.pack(side="left", padx=8)
         self.limit_entry.insert(0, "60")  # default
+        # Off by default: the temp-file + rename pair doubles metadata operations per
+        # file, which dominates on network shares and archives with many small files.
+        self.atomic_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(limit_frame, text="Atomic writes (safer, slower on network shares)",
+                       variable=self.atomic_var).pack(side="left", padx=12)
 
         # Row 3: Progress
         self.progress = ttk.Progressbar(master, orient="horizontal", length=680, mode="determinate")
@@ -78,16 +132,59 @@ class ZipRenameExtractor:
         )
         self.status_label.grid(row=5, column=0, columnspan=3, padx=10, sticky="w")
 
-        self._cancel = False
+        self._cancel = threading.Event()
+        self._name_lock = threading.Lock()
+        self._used_names = set()
+        self._atomic_writes = False
+        self._ui_lock = threading.Lock()
+        self._pending_progress = None
+        self._pending_status = None
+        self._ui_q = queue.SimpleQueue()
         self._worker = None
 
+        self._drain_ui()
+
     # --- thread-safe UI calls ---
     def ui(self, fn, *args, **kwargs):
-        self.master.after(0, fn, *args, **kwargs)
+        self._ui_q.put((fn, args, kwargs))
+
+    def _drain_ui(self):
+        # Runs on the Tk thread: apply everything workers queued since the last tick
+        while True:
+            try:
+                fn, args, kwargs = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args, **kwargs)
+            except Exception:
+                # Report like any Tk callback error, but keep draining the rest
+                self.master.report_callback_exception(*sys.exc_info())
+        try:
+            self._flush_ui()
+        finally:
+            self.master.after(UI_TICK_MS, self._drain_ui)
 
     def set_status(self, text):
         self.status_label.config(text=text)
 
+    def post_progress(self, value=None, status=None):
+        # Record the latest progress/status; the next _drain_ui tick applies it
+        with self._ui_lock:
+            if value is not None:
+                self._pending_progress = value
+            if status is not None:
+                self._pending_status = status
+
+    def _flush_ui(self):
+        with self._ui_lock:
+            value, status = self._pending_progress, self._pending_status
+            self._pending_progress = self._pending_status = None
+        if value is not None:
+            self.progress.config(value=value)
+        if status is not None:
+            self.set_status(status)
+
     def set_buttons_running(self, running: bool):
         self.extract_btn.config(state="disabled" if running else "normal")
         self.cancel_btn.config(state="normal" if running else "disabled")
@@ -109,7 +206,8 @@ class ZipRenameExtractor:
     def start_extract_thread(self):
         if self._worker and self._worker.is_alive():
             return
-        self._cancel = False
+        self._cancel.clear()
+        self._atomic_writes = self.atomic_var.get()
         self.set_buttons_running(True)
         self.ui(self.set_status, "Status: Working…")
         self.ui(lambda: self.progress.config(value=0))
@@ -117,7 +215,7 @@ class ZipRenameExtractor:
         self._worker.start()
 
     def request_cancel(self):
-        self._cancel = True
+        self._cancel.set()
         self.ui(self.set_status, "Status: Cancelling…")
 
     # --- helpers ---
@@ -127,7 +225,7 @@ class ZipRenameExtractor:
             return None  # blank => no limit
         try:
             # normalize locale digits (e.g., Thai "๖๐") to ASCII
-            norm = "".join(str(unicodedata.digit(c)) if c.isdigit() else c for c in txt)
+            norm = txt.translate(_DIGIT_TRANS)
             n = int(norm)
             return None if n <= 0 else n
         except Exception:
@@ -146,8 +244,9 @@ class ZipRenameExtractor:
         if not os.path.isdir(zip_folder) or not os.path.isdir(output_folder):
             return self.ui(messagebox.showerror, "Error", "Please select valid folders.")
 
-        all_names = sorted(os.listdir(zip_folder))
-        archives = [f for f in all_names if f.lower().endswith((".zip", ".7z"))]
+        with os.scandir(zip_folder) as it:
+            archives = sorted(e.name for e in it
+                              if e.name.lower().endswith((".zip", ".7z")) and e.is_file())
 
         if not archives:
             return self.ui(messagebox.showinfo, "Info", "No .zip or .7z files found.")
@@ -162,126 +261,26 @@ class ZipRenameExtractor:
         self.ui(lambda: self.progress.config(value=0))
 
         errors = []
-
-        for i, arc_name in enumerate(archives, 1):
-            if self._cancel:
-                break
-
-            arc_path = os.path.join(zip_folder, arc_name)
-            arc_prefix = sanitize_filename(os.path.splitext(arc_name)[0])
-
-            try:
-                if arc_name.lower().endswith(".zip"):
-                    zf = None
-                    try:
-                        zf = zipfile.ZipFile(arc_path, 'r', allowZip64=True)
-                        # Filter to files only (dirs can be ambiguous; check by trailing slash)
-                        members = [zi for zi in zf.infolist() if not zi.filename.endswith(('/', '\\'))]
-
-                        # Sort by ZIP internal datetime (newest first)
-                        def _zip_mtime(zi):
-                            try:
-                                y, mo, d, hh, mm, ss = zi.date_time
-                                return datetime(y, mo, d, hh, mm, ss)
-                            except Exception:
-                                return datetime.min
-
-                        members.sort(key=_zip_mtime, reverse=True)
-                        selected = members[:limit] if isinstance(limit, int) else members
-
-                        # Optional feedback
-                        self.ui(self.set_status, f"{arc_name}: selecting {len(selected)}/{len(members)} newest files")
-
-                        for zi in selected:
-                            if self._cancel:
-                                break
-                            base = os.path.basename(zi.filename)
-                            if not base:
-                                continue
-
-                            original_name = sanitize_filename(base)
-                            new_name = sanitize_filename(f"{arc_prefix}_{original_name}")
-                            dest_path = unique_path(os.path.join(output_folder, new_name))
-
-                            try:
-                                with zf.open(zi, 'r') as source:
-                                    fd, tmp_path = tempfile.mkstemp(prefix="arcx_", dir=output_folder)
-                                    with os.fdopen(fd, 'wb') as tmp:
-                                        shutil.copyfileobj(source, tmp, length=1024 * 1024)
-                                os.replace(tmp_path, dest_path)
-                            except Exception as inner_e:
-                                try:
-                                    if 'tmp_path' in locals() and os.path.exists(tmp_path):
-                                        os.remove(tmp_path)
-                                finally:
-                                    raise inner_e
-                    finally:
-                        if zf:
-                            zf.close()
-
+        self._used_names = set()
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            zip_prefix = _dir_prefix(zip_folder)
+            futures = [pool.submit(self._process_archive, arc_name, limit, output_folder, zip_prefix)
+                       for arc_name in archives]
+            for i, future in enumerate(as_completed(futures), 1):
+                arc_name, error = future.result()
+                if error:
+                    errors.append(f"{arc_name}: {error}")
+                    self.post_progress(i, f"Error: {arc_name} — {error}")
+                elif not self._cancel.is_set():
+                    self.post_progress(i, f"Extracted: {arc_name}")
                 else:
-                    # --- .7z handling: extract to temp, select newest N by mtime, prefix, atomic move ---
-                    if not PY7ZR_AVAILABLE:
-                        raise RuntimeError("py7zr not available to open .7z")
-
-                    zf = None
-                    try:
-                        zf = py7zr.SevenZipFile(arc_path, mode='r')  # type: ignore
-                        with tempfile.TemporaryDirectory() as tmpdir:
-                            zf.extractall(path=tmpdir)
-
-                            collected = []
-                            for root, _, files in os.walk(tmpdir):
-                                for fname in files:
-                                    if self._cancel:
-                                        break
-                                    p = os.path.join(root, fname)
-                                    try:
-                                        mt = os.path.getmtime(p)
-                                    except Exception:
-                                        mt = 0
-                                    collected.append((p, fname, mt))
-
-                            # Newest first by filesystem mtime
-                            collected.sort(key=lambda t: t[2], reverse=True)
-                            selected = collected[:limit] if isinstance(limit, int) else collected
-
-                            self.ui(self.set_status, f"{arc_name}: selecting {len(selected)}/{len(collected)} newest files")
-
-                            for src_path, fname, _mt in selected:
-                                if self._cancel:
-                                    break
-                                original_name = sanitize_filename(fname)
-                                new_name = sanitize_filename(f"{arc_prefix}_{original_name}")
-                                dest_path = unique_path(os.path.join(output_folder, new_name))
-
-                                # atomic write into output folder
-                                try:
-                                    fd, tmp_path = tempfile.mkstemp(prefix="arcx_", dir=output_folder)
-                                    with os.fdopen(fd, 'wb') as tmp, open(src_path, 'rb') as src:
-                                        shutil.copyfileobj(src, tmp, length=1024 * 1024)
-                                    os.replace(tmp_path, dest_path)
-                                except Exception as inner_e:
-                                    try:
-                                        if 'tmp_path' in locals() and os.path.exists(tmp_path):
-                                            os.remove(tmp_path)
-                                    finally:
-                                        raise inner_e
-                    finally:
-                        if zf:
-                            zf.close()
-
-                self.ui(self.set_status, f"Extracted: {arc_name}")
-
-            except Exception as e:
-                errors.append(f"{arc_name}: {e}")
-                self.ui(self.set_status, f"Error: {arc_name} — {e}")
-
-            self.ui(lambda v=i: self.progress.config(value=v))
+                    self.post_progress(i)
 
         def finish():
+            self._flush_ui()
             self.set_buttons_running(False)
-            if self._cancel:
+            if self._cancel.is_set():
                 self.set_status("Status: Cancelled")
                 messagebox.showinfo("Cancelled", "Operation was cancelled.")
             elif errors:
@@ -296,6 +295,158 @@ class ZipRenameExtractor:
 
         self.ui(finish)
 
+    # --- per-archive worker (runs on a pool thread) ---
+    def _process_archive(self, arc_name, limit, output_folder, zip_prefix):
+        # Returns (arc_name, error or None)
+        if self._cancel.is_set():
+            return arc_name, None
+
+        arc_path = zip_prefix + arc_name
+        out_prefix = _dir_prefix(output_folder)
+        arc_prefix = sanitize_filename(os.path.splitext(arc_name)[0])
+
+        try:
+            if arc_name.lower().endswith(".zip"):
+                zf = None
+                try:
+                    zf = zipfile.ZipFile(arc_path, 'r', allowZip64=True)
+                    # Files only (dirs can be ambiguous; check by trailing slash), paired
+                    # with their basename split on either separator in the same pass
+                    members = []
+                    for zi in zf.infolist():
+                        n = zi.filename
+                        if not n or n[-1] in '/\\':
+                            continue
+                        members.append((zi, n.rsplit('/', 1)[-1].rsplit('\\', 1)[-1]))
+
+                    if limit is None:
+                        # No cap: everything is kept and infolist() is already in archive order
+                        selected = members
+                    else:
+                        # Sort by ZIP internal datetime (newest first); the raw
+                        # (Y, M, D, h, m, s) tuple orders the same as a datetime
+                        members.sort(key=lambda m: m[0].date_time, reverse=True)
+                        selected = members[:limit]
+                        # Read the chosen members in archive order so I/O stays sequential
+                        selected.sort(key=lambda m: m[0].header_offset)
+
+                    # Optional feedback
+                    self.post_progress(status=f"{arc_name}: selecting {len(selected)}/{len(members)} newest files")
+
+                    is_cancelled = self._cancel.is_set
+                    for count, (zi, base) in enumerate(selected):
+                        if (count & CANCEL_POLL_MASK) == 0 and is_cancelled():
+                            break
+
+                        original_name = sanitize_filename(base)
+                        new_name = f"{arc_prefix}_{original_name}"
+
+                        if not self._atomic_writes:
+                            self._write_member(zf, zi, out_prefix, new_name)
+                            continue
+
+                        try:
+                            with zf.open(zi, 'r') as source:
+                                fd, tmp_path = tempfile.mkstemp(prefix="arcx_", dir=output_folder)
+                                with os.fdopen(fd, 'wb', buffering=COPY_BUFSIZE) as tmp:
+                                    _copy(source, tmp)
+                            self._move_to_output(tmp_path, out_prefix, new_name)
+                        except Exception as inner_e:
+                            try:
+                                if 'tmp_path' in locals() and os.path.exists(tmp_path):
+                                    os.remove(tmp_path)
+                            finally:
+                                raise inner_e
+                finally:
+                    if zf:
+                        zf.close()
+
+            else:
+                # --- .7z handling: select newest N by mtime from the listing, extract only those, prefix, move ---
+                if not PY7ZR_AVAILABLE:
+                    raise RuntimeError("py7zr not available to open .7z")
+
+                zf = None
+                try:
+                    zf = _open_7z(arc_path)
+                    # Select from the header listing so discarded entries are never decompressed
+                    infos = [fi for fi in zf.list() if not fi.is_directory]
+                    if limit is None:
+                        selected = infos
+                    else:
+                        infos.sort(key=_7z_mtime, reverse=True)
+                        selected = infos[:limit]
+
+                    self.post_progress(status=f"{arc_name}: selecting {len(selected)}/{len(infos)} newest files")
+
+                    if selected and not self._cancel.is_set():
+                        # Extract on the output volume so each file is moved by rename, not copied
+                        with tempfile.TemporaryDirectory(prefix="arcx_", dir=output_folder) as tmpdir:
+                            if SEVENZIP_WORKERS > 1 and len(selected) > 1 and not zf.archiveinfo().solid:
+                                # Non-solid: every entry is its own stream, so disjoint target
+                                # sets decode independently on separate handles
+                                buckets = _balance_by_size(selected, SEVENZIP_WORKERS)
+                                with ThreadPoolExecutor(max_workers=len(buckets)) as pool:
+                                    list(pool.map(functools.partial(_7z_extract_targets, arc_path, tmpdir), buckets))
+                            else:
+                                zf.reset()  # rewind after list() so extract() starts from the first block
+                                zf.extract(path=tmpdir, targets=[fi.filename for fi in selected])
+
+                            tmp_prefix = tmpdir + os.sep
+                            is_cancelled = self._cancel.is_set
+                            for count, fi in enumerate(selected):
+                                if (count & CANCEL_POLL_MASK) == 0 and is_cancelled():
+                                    break
+                                fname = os.path.basename(fi.filename)
+                                if not fname:
+                                    continue
+                                original_name = sanitize_filename(fname)
+                                new_name = f"{arc_prefix}_{original_name}"
+                                self._move_to_output(tmp_prefix + fi.filename, out_prefix, new_name)
+                finally:
+                    if zf:
+                        zf.close()
+        except Exception as e:
+            return arc_name, e
+        return arc_name, None
+
+    def unique_path_cached(self, base_path):
+        # Like unique_path(), but names already placed this run are rejected without a stat.
+        # Call with _name_lock held.
+        name = os.path.basename(base_path)
+        if name not in self._used_names and not os.path.exists(base_path):
+            self._used_names.add(name)
+            return base_path
+        root, ext = os.path.splitext(base_path)
+        i = 1
+        while True:
+            candidate = f"{root} ({i}){ext}"
+            name = os.path.basename(candidate)
+            if name not in self._used_names and not os.path.exists(candidate):
+                self._used_names.add(name)
+                return candidate
+            i += 1
+
+    def _write_member(self, zf, zi, out_prefix, new_name):
+        # Non-atomic fast path: claim the final name, then stream straight into it
+        with self._name_lock:
+            dest_path = self.unique_path_cached(out_prefix + new_name)
+            dst = open(dest_path, 'xb', buffering=COPY_BUFSIZE)
+        try:
+            with dst, zf.open(zi, 'r') as src:
+                _copy(src, dst)
+        except Exception:
+            try:
+                os.remove(dest_path)
+            finally:
+                raise
+
+    def _move_to_output(self, src_path, out_prefix, new_name):
+        # Pick the free name and claim it in one step so parallel archives can't collide
+        with self._name_lock:
+            dest_path = self.unique_path_cached(out_prefix + new_name)
+            os.replace(src_path, dest_path)
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = ZipRenameExtractor(root)
@@ -3,52 +3,85 @@ import zipfile
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import shutil
 import tempfile
 import re
 from datetime import datetime
 import unicodedata  # for Thai/locale digits
 import json
+import inspect
+import heapq
+import operator
+import functools
 
 # --- Optional 7z support ---
 try:
     import py7zr  # pip install py7zr
     PY7ZR_AVAILABLE = True
+    # Very old py7zr releases can only extractall()
+    PY7ZR_HAS_TARGETS = "targets" in inspect.signature(py7zr.SevenZipFile.extract).parameters
 except Exception:
     PY7ZR_AVAILABLE = False
-
-INVALID_WIN_CHARS = r'[<>:"/\\|?*\x00-\x1F]'
-DATE_REGEX = re.compile(r"\d{4}-\d{2}-\d{2}")  # YYYY-MM-DD
+    PY7ZR_HAS_TARGETS = False
+
+# Windows-invalid characters and C0 controls -> "_"
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'} | {chr(i): "_" for i in range(0x20)})
+DATE_REGEX = re.compile(r"(\d{4})-(\d{2})-(\d{2})", re.ASCII)  # YYYY-MM-DD, ASCII digits only
+_DATE_SEARCH = DATE_REGEX.search
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+SMALL_MEMBER_SIZE = 256 * 1024  # read whole, write once
 PREFS_FILE = os.path.join(os.path.expanduser("~"), ".zip_rename_extractor_prefs.json")
+PREFS_SAVE_DELAY_MS = 500  # coalesce bursts of FocusOut/mode/browse saves
 
 
 def sanitize_filename(name: str) -> str:
-    name = re.sub(INVALID_WIN_CHARS, "_", name).strip().rstrip(". ")
-    return name or "unnamed"
+    return name.translate(_SANITIZE_TABLE).strip().rstrip(". ") or "unnamed"
 
 
-def unique_path(base_path: str) -> str:
-    if not os.path.exists(base_path):
-        return base_path
-    root, ext = os.path.splitext(base_path)
-    i = 1
-    while True:
+def unique_path(base_path: str, existing: set) -> str:
+    # `existing` holds the normcased names already in the folder; the chosen name is added to it
+    folder, name = os.path.split(base_path)
+    root, ext = os.path.splitext(name)
+    candidate, i = name, 1
+    while os.path.normcase(candidate) in existing:
         candidate = f"{root} ({i}){ext}"
-        if not os.path.exists(candidate):
-            return candidate
         i += 1
+    existing.add(os.path.normcase(candidate))
+    return os.path.join(folder, candidate)
 
 
-def extract_date_from_name(name: str):
-    m = DATE_REGEX.search(name)
-    if not m:
-        return None
+@functools.lru_cache(maxsize=4096)
+def _parse_date(s: str):
+    # s is a DATE_REGEX match ("YYYY-MM-DD"); rotated logs share a handful of these
     try:
-        return datetime.strptime(m.group(), "%Y-%m-%d").date()
-    except Exception:
+        return datetime(int(s[:4]), int(s[5:7]), int(s[8:10])).date()
+    except ValueError:
         return None
 
 
+def _build_range_filter(start_date, end_date):
+    """Return name -> bool: True if the name contains a date (YYYY-MM-DD) within [start, end]."""
+    # ISO dates order the same as strings, so the bounds check runs on the matched text;
+    # only hits inside the range are validated as real calendar dates.
+    lo = start_date.isoformat() if start_date else "0000-00-00"
+    hi = end_date.isoformat() if end_date else "9999-99-99"
+
+    def in_range(name):
+        m = _DATE_SEARCH(name)
+        if not m:
+            return False
+        s = m.group()
+        return lo <= s <= hi and _parse_date(s) is not None
+
+    return in_range
+
+
+def _7z_mtime(fi) -> float:
+    t = fi.creationtime  # py7zr reports the entry's last-write time here
+    return t.timestamp() if t else 0
+
+
 class ZipRenameExtractor:
     def __init__(self, master):
         self.master = master
@@ -119,6 +152,11 @@ class ZipRenameExtractor:
 
         self._cancel = False
         self._worker = None
+        self._name_lock = threading.Lock()
+        self._existing_names = set()
+        self._ui_lock = threading.Lock()
+        self._prefs_job = None
+        self._last_saved_prefs = None
 
         # Load and apply last selections
         self.load_prefs()
@@ -137,9 +175,20 @@ class ZipRenameExtractor:
         }
 
     def save_prefs(self):
+        if self._prefs_job is None:
+            self._prefs_job = self.master.after(PREFS_SAVE_DELAY_MS, self._flush_prefs)
+
+    def _flush_prefs(self):
+        if self._prefs_job is not None:
+            self.master.after_cancel(self._prefs_job)
+            self._prefs_job = None
+        prefs = self.current_prefs()
+        if prefs == self._last_saved_prefs:
+            return
         try:
             with open(PREFS_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.current_prefs(), f, ensure_ascii=False, indent=2)
+                json.dump(prefs, f, ensure_ascii=False, indent=2)
+            self._last_saved_prefs = prefs
         except Exception:
             # Don't crash on prefs save errors
             pass
@@ -151,6 +200,7 @@ class ZipRenameExtractor:
                     data = json.load(f)
                 # Populate fields if present
                 if isinstance(data, dict):
+                    self._last_saved_prefs = data
                     if data.get("zip_folder"):
                         self.zip_folder_entry.delete(0, tk.END)
                         self.zip_folder_entry.insert(0, data["zip_folder"])
@@ -179,7 +229,7 @@ class ZipRenameExtractor:
             pass
 
     def on_close(self):
-        self.save_prefs()
+        self._flush_prefs()
         self.master.destroy()
 
     # --- UI helpers ---
@@ -194,7 +244,9 @@ class ZipRenameExtractor:
         self.end_entry.config(state=("disabled" if use_recent else "normal"))
 
     def ui(self, fn, *args, **kwargs):
-        self.master.after(0, fn, *args, **kwargs)
+        # Called from several pool threads at once
+        with self._ui_lock:
+            self.master.after(0, fn, *args, **kwargs)
 
     def set_status(self, text):
         self.status_label.config(text=text)
@@ -226,7 +278,7 @@ class ZipRenameExtractor:
         self.set_buttons_running(True)
         self.ui(self.set_status, "Status: Working…")
         self.ui(lambda: self.progress.config(value=0))
-        self.save_prefs()  # persist current selections before running
+        self._flush_prefs()  # persist current selections before running
         self._worker = threading.Thread(target=self.extract_and_rename, daemon=True)
         self._worker.start()
 
@@ -262,17 +314,6 @@ class ZipRenameExtractor:
             return "empty"  # in date mode, require at least one bound
         return (start_date, end_date)
 
-    def is_in_range(self, fname, start_date, end_date):
-        """True if filename contains a date (YYYY-MM-DD) within [start, end]."""
-        d = extract_date_from_name(fname)
-        if not d:
-            return False
-        if start_date and d < start_date:
-            return False
-        if end_date and d > end_date:
-            return False
-        return True
-
     # --- core ---
     def extract_and_rename(self):
         zip_folder = self.zip_folder_entry.get()
@@ -295,7 +336,9 @@ class ZipRenameExtractor:
         if not os.path.isdir(zip_folder) or not os.path.isdir(output_folder):
             return self.ui(messagebox.showerror, "Error", "Please select valid folders.")
 
-        archives = sorted(f for f in os.listdir(zip_folder) if f.lower().endswith((".zip", ".7z")))
+        with os.scandir(zip_folder) as it:
+            archives = sorted(e.name for e in it
+                              if e.name.lower().endswith((".zip", ".7z")) and e.is_file())
         if not archives:
             return self.ui(messagebox.showinfo, "Info", "No .zip or .7z files found.")
 
@@ -311,35 +354,23 @@ class ZipRenameExtractor:
         self.ui(lambda: self.progress.config(value=0))
 
         errors = []
+        # One listing up front; unique_path() checks this set instead of stat'ing each candidate
+        self._existing_names = {os.path.normcase(n) for n in os.listdir(output_folder)}
 
-        for i, arc_name in enumerate(archives, 1):
-            if self._cancel:
-                break
-
-            arc_path = os.path.join(zip_folder, arc_name)
-            arc_prefix = sanitize_filename(os.path.splitext(arc_name)[0])
-
-            try:
-                if arc_name.lower().endswith(".zip"):
-                    if mode == "recent":
-                        self._zip_extract_recent(arc_path, output_folder, arc_prefix, limit)
-                    else:
-                        start_date, end_date = date_range
-                        self._zip_extract_by_date(arc_path, output_folder, arc_prefix, start_date, end_date)
-                else:
-                    if mode == "recent":
-                        self._7z_extract_recent(arc_path, output_folder, arc_prefix, limit)
-                    else:
-                        start_date, end_date = date_range
-                        self._7z_extract_by_date(arc_path, output_folder, arc_prefix, start_date, end_date)
-
-                self.ui(self.set_status, f"Extracted: {arc_name}")
-
-            except Exception as e:
-                errors.append(f"{arc_name}: {e}")
-                self.ui(self.set_status, f"Error: {arc_name} — {e}")
-
-            self.ui(lambda v=i: self.progress.config(value=v))
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        futures = {executor.submit(self._process_one_archive, arc_name, zip_folder, output_folder,
+                                   mode, limit, date_range): arc_name
+                   for arc_name in archives}
+        try:
+            for i, future in enumerate(as_completed(futures), 1):
+                error = future.result()
+                if error:
+                    errors.append(f"{futures[future]}: {error}")
+                self.ui(lambda v=i: self.progress.config(value=v))
+                if self._cancel:
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
         def finish():
             self.set_buttons_running(False)
@@ -355,55 +386,87 @@ class ZipRenameExtractor:
 
         self.ui(finish)
 
+    def _process_one_archive(self, arc_name, zip_folder, output_folder, mode, limit, date_range):
+        """Extract a single archive on a pool thread; returns the error, or None."""
+        if self._cancel:
+            return None
+
+        arc_path = os.path.join(zip_folder, arc_name)
+        arc_prefix = sanitize_filename(os.path.splitext(arc_name)[0])
+
+        try:
+            if arc_name.lower().endswith(".zip"):
+                # Parse the central directory once; the strategies share this handle
+                with zipfile.ZipFile(arc_path, 'r', allowZip64=True) as zf:
+                    if mode == "recent":
+                        self._zip_extract_recent(zf, arc_name, output_folder, arc_prefix, limit)
+                    else:
+                        start_date, end_date = date_range
+                        self._zip_extract_by_date(zf, arc_name, output_folder, arc_prefix, start_date, end_date)
+            else:
+                if mode == "recent":
+                    self._7z_extract_recent(arc_path, output_folder, arc_prefix, limit)
+                else:
+                    start_date, end_date = date_range
+                    self._7z_extract_by_date(arc_path, output_folder, arc_prefix, start_date, end_date)
+
+            self.ui(self.set_status, f"Extracted: {arc_name}")
+            return None
+
+        except Exception as e:
+            self.ui(self.set_status, f"Error: {arc_name} — {e}")
+            return e
+
     # --- ZIP strategies ---
-    def _zip_extract_recent(self, arc_path, output_folder, arc_prefix, limit):
-        with zipfile.ZipFile(arc_path, 'r', allowZip64=True) as zf:
-            members = [zi for zi in zf.infolist() if not zi.filename.endswith(('/', '\\'))]
-            # newest first by ZIP internal timestamp
-            def _mtime(zi):
-                try:
-                    y, mo, d, hh, mm, ss = zi.date_time
-                    return datetime(y, mo, d, hh, mm, ss)
-                except Exception:
-                    return datetime.min
-            members.sort(key=_mtime, reverse=True)
-            selected = members[:limit] if isinstance(limit, int) else members
-            self.ui(self.set_status, f"{os.path.basename(arc_path)}: selecting {len(selected)}/{len(members)} newest files")
-
-            for zi in selected:
-                if self._cancel:
-                    break
-                base = os.path.basename(zi.filename)
-                if not base:
-                    continue
-                self._zip_copy_member(zf, zi, output_folder, arc_prefix, base)
-
-    def _zip_extract_by_date(self, arc_path, output_folder, arc_prefix, start_date, end_date):
-        with zipfile.ZipFile(arc_path, 'r', allowZip64=True) as zf:
-            members = [zi for zi in zf.infolist() if not zi.filename.endswith(('/', '\\'))]
-            # filter by date in filename only
-            members = [zi for zi in members if self.is_in_range(zi.filename, start_date, end_date)]
-            self.ui(self.set_status, f"{os.path.basename(arc_path)}: selecting {len(members)} by date")
-            for zi in members:
-                if self._cancel:
-                    break
-                base = os.path.basename(zi.filename)
-                if not base:
-                    continue
-                self._zip_copy_member(zf, zi, output_folder, arc_prefix, base)
+    def _zip_extract_recent(self, zf, arc_name, output_folder, arc_prefix, limit):
+        files = (zi for zi in zf.infolist() if not zi.filename.endswith(('/', '\\')))
+        if isinstance(limit, int):
+            # newest first by ZIP internal timestamp; the (y, mo, d, hh, mm, ss) tuple sorts like a datetime
+            selected = heapq.nlargest(limit, files, key=operator.attrgetter('date_time'))
+        else:
+            selected = list(files)
+        self.ui(self.set_status, f"{arc_name}: selecting {len(selected)} newest files")
+        self._zip_extract_members(zf, selected, output_folder, arc_prefix)
+
+    def _zip_extract_by_date(self, zf, arc_name, output_folder, arc_prefix, start_date, end_date):
+        # filter by date in filename only
+        in_range = _build_range_filter(start_date, end_date)
+        selected = [zi for zi in zf.infolist()
+                    if not zi.filename.endswith(('/', '\\')) and in_range(zi.filename)]
+        self.ui(self.set_status, f"{arc_name}: selecting {len(selected)} by date")
+        self._zip_extract_members(zf, selected, output_folder, arc_prefix)
+
+    def _zip_extract_members(self, zf, selected, output_folder, arc_prefix):
+        # read in archive order so the buffered reader only moves forward
+        selected.sort(key=lambda zi: zi.header_offset)
+        for zi in selected:
+            if self._cancel:
+                break
+            base = os.path.basename(zi.filename)
+            if not base:
+                continue
+            self._zip_copy_member(zf, zi, output_folder, arc_prefix, base)
 
     def _zip_copy_member(self, zf, zi, output_folder, arc_prefix, base):
-        new_name = sanitize_filename(f"{arc_prefix}_{sanitize_filename(base)}")
-        dest_path = unique_path(os.path.join(output_folder, new_name))
-        fd, tmp_path = tempfile.mkstemp(prefix="arcx_", dir=output_folder)
+        new_name = f"{arc_prefix}_{sanitize_filename(base)}"  # arc_prefix is already sanitized
+        # Pick and create the name in one step so parallel archives can't claim it twice
+        with self._name_lock:
+            dest_path = unique_path(os.path.join(output_folder, new_name), self._existing_names)
+            dst = open(dest_path, 'xb')
+        # Write straight to the destination (no temp file + rename)
         try:
-            with os.fdopen(fd, 'wb') as tmp, zf.open(zi, 'r') as src:
-                shutil.copyfileobj(src, tmp, length=1024 * 1024)
-            os.replace(tmp_path, dest_path)
+            with dst:
+                if zi.file_size <= SMALL_MEMBER_SIZE:
+                    dst.write(zf.read(zi))
+                else:
+                    # one read/write round trip per chunk, capped at 8 MiB
+                    length = min(zi.file_size, 8 * 1024 * 1024)
+                    with zf.open(zi, 'r') as src:
+                        shutil.copyfileobj(src, dst, length=length)
         except Exception:
             try:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
+                if os.path.exists(dest_path):
+                    os.remove(dest_path)
             finally:
                 raise
 
@@ -411,60 +474,42 @@ class ZipRenameExtractor:
     def _7z_extract_recent(self, arc_path, output_folder, arc_prefix, limit):
         if not PY7ZR_AVAILABLE:
             raise RuntimeError("py7zr not installed")
-        with py7zr.SevenZipFile(arc_path, mode='r') as zf, tempfile.TemporaryDirectory() as tmpdir:
-            zf.extractall(path=tmpdir)
-            collected = []
-            for root, _, files in os.walk(tmpdir):
-                for fname in files:
-                    p = os.path.join(root, fname)
-                    try:
-                        mt = os.path.getmtime(p)
-                    except Exception:
-                        mt = 0
-                    collected.append((p, fname, mt))
-
-            collected.sort(key=lambda t: t[2], reverse=True)
-            selected = collected[:limit] if isinstance(limit, int) else collected
-            self.ui(self.set_status, f"{os.path.basename(arc_path)}: selecting {len(selected)}/{len(collected)} newest files")
-
-            for src_path, fname, _ in selected:
-                if self._cancel:
-                    break
-                self._file_copy_to_output(src_path, output_folder, arc_prefix, fname)
+        with py7zr.SevenZipFile(arc_path, mode='r') as zf:
+            # Select from the header listing; unselected entries are never decompressed
+            infos = [fi for fi in zf.list() if not fi.is_directory]
+            selected = heapq.nlargest(limit, infos, key=_7z_mtime) if isinstance(limit, int) else infos
+            self.ui(self.set_status, f"{os.path.basename(arc_path)}: selecting {len(selected)}/{len(infos)} newest files")
+            self._7z_extract_selected(zf, output_folder, arc_prefix, selected)
 
     def _7z_extract_by_date(self, arc_path, output_folder, arc_prefix, start_date, end_date):
         if not PY7ZR_AVAILABLE:
             raise RuntimeError("py7zr not installed")
-        with py7zr.SevenZipFile(arc_path, mode='r') as zf, tempfile.TemporaryDirectory() as tmpdir:
-            zf.extractall(path=tmpdir)
-            collected = []
-            for root, _, files in os.walk(tmpdir):
-                for fname in files:
-                    if not self.is_in_range(fname, start_date, end_date):
-                        continue
-                    p = os.path.join(root, fname)
-                    collected.append((p, fname))
-
-            self.ui(self.set_status, f"{os.path.basename(arc_path)}: selecting {len(collected)} by date")
-            for src_path, fname in collected:
+        with py7zr.SevenZipFile(arc_path, mode='r') as zf:
+            in_range = _build_range_filter(start_date, end_date)
+            selected = [fi for fi in zf.list()
+                        if not fi.is_directory and in_range(os.path.basename(fi.filename))]
+            self.ui(self.set_status, f"{os.path.basename(arc_path)}: selecting {len(selected)} by date")
+            self._7z_extract_selected(zf, output_folder, arc_prefix, selected)
+
+    def _7z_extract_selected(self, zf, output_folder, arc_prefix, selected):
+        if not selected or self._cancel:
+            return
+        # Stage inside the output folder so each kept file is renamed into place, not copied
+        with tempfile.TemporaryDirectory(prefix="arcx_", dir=output_folder) as tmpdir:
+            if PY7ZR_HAS_TARGETS:
+                zf.extract(path=tmpdir, targets=[fi.filename for fi in selected])
+            else:
+                zf.extractall(path=tmpdir)
+            for fi in selected:
                 if self._cancel:
                     break
-                self._file_copy_to_output(src_path, output_folder, arc_prefix, fname)
-
-    def _file_copy_to_output(self, src_path, output_folder, arc_prefix, fname):
-        new_name = sanitize_filename(f"{arc_prefix}_{sanitize_filename(fname)}")
-        dest_path = unique_path(os.path.join(output_folder, new_name))
-        fd, tmp_path = tempfile.mkstemp(prefix="arcx_", dir=output_folder)
-        try:
-            with os.fdopen(fd, 'wb') as tmp, open(src_path, 'rb') as src:
-                shutil.copyfileobj(src, tmp, length=1024 * 1024)
-            os.replace(tmp_path, dest_path)
-        except Exception:
-            try:
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-            finally:
-                raise
+                fname = os.path.basename(fi.filename)
+                if not fname:
+                    continue
+                new_name = f"{arc_prefix}_{sanitize_filename(fname)}"
+                with self._name_lock:
+                    dest_path = unique_path(os.path.join(output_folder, new_name), self._existing_names)
+                    os.replace(os.path.join(tmpdir, fi.filename), dest_path)
 
 
 if __name__ == "__main__":
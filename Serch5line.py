@@ -1,11 +1,25 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import csv
+import mmap
+import os
+
+CONTEXT_LINES = 5
+
 
 def browse_file():
     file_path.set(filedialog.askopenfilename(filetypes=[("Text files", "*.txt *.log")]))
 
 
+def decode_lines(raw):
+    # bytes -> list of lines (keeping '\n'), as text-mode iteration would return them
+    parts = raw.replace(b'\r\n', b'\n').decode('utf-8', errors='ignore').split('\n')
+    lines = [part + '\n' for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
 def search():
     filepath = file_path.get()
     word1 = entry_word1.get()
@@ -16,19 +30,34 @@ def search():
         return
 
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as file:
-            lines = file.readlines()
-
         results.clear()
         text_output.delete("1.0", tk.END)
 
-        for i, line in enumerate(lines):
-            if word1 in line and word2 in line:
-                start = max(0, i - 5)
-                context = lines[start:i+1]
-                result_block = f"\n--- Found at line {i+1} ---\n" + ''.join(context)
-                text_output.insert(tk.END, result_block)
-                results.append((i+1, context))
+        # Search the raw bytes; only matched lines and their context are decoded
+        w1, w2 = word1.encode('utf-8'), word2.encode('utf-8')
+        with open(filepath, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                line_no, last = 1, 0
+                pos = mm.find(w1)
+                while pos != -1:
+                    start = mm.rfind(b'\n', 0, pos) + 1
+                    end = mm.find(b'\n', pos)
+                    end = len(mm) if end == -1 else end + 1
+                    if w2 in mm[start:end]:
+                        line_no += mm[last:start].count(b'\n')
+                        last = start
+                        ctx = start
+                        for _ in range(CONTEXT_LINES):
+                            if ctx == 0:
+                                break
+                            ctx = mm.rfind(b'\n', 0, ctx - 1) + 1
+                        context = decode_lines(mm[ctx:end])
+                        result_block = f"\n--- Found at line {line_no} ---\n" + ''.join(context)
+                        text_output.insert(tk.END, result_block)
+                        results.append((line_no, context))
+                    pos = mm.find(w1, end)
 
     except Exception as e:
         messagebox.showerror("Error", f"Failed to read file:\n{str(e)}")
@@ -1,17 +1,25 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
+CHUNK_SIZE = 1024 * 1024
+
 def count_text():
     filepath = filedialog.askopenfilename(filetypes=[("Text files", "*.txt")])
     if not filepath:
         return
 
     try:
+        word_count = 0
+        char_count = 0
+        in_word = False  # previous chunk ended mid-word
         with open(filepath, 'r', encoding='utf-8') as file:
-            text = file.read()
-
-        word_count = len(text.split())
-        char_count = len(text)
+            # Stream in 1 MiB chunks so memory stays flat on multi-GB files
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), ''):
+                char_count += len(chunk)
+                word_count += len(chunk.split())
+                if in_word and not chunk[0].isspace():
+                    word_count -= 1  # word split across the chunk boundary
+                in_word = not chunk[-1].isspace()
 
         result_label.config(text=f"File: {filepath}\nWords: {word_count}\nCharacters: {char_count}")
 
@@ -7,23 +7,22 @@ import platform
 
 EXE_PATH = os.environ.get("VSS_EXE_PATH", r"C:\VCP-Lite\Base\FELINK\Security\Lockdown_active.exe")
 APP_VERSION = "Version 2.0 VCP Lite7"
+CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0) if platform.system() == "Windows" else 0
 
 def on_lockdown():
     lock_btn.config(state=tk.DISABLED)
-    if not os.path.exists(EXE_PATH):
-        messagebox.showerror("Error", f"File not found:\n{EXE_PATH}")
-        lock_btn.config(state=tk.NORMAL)
-        return
-
+    # No exists() pre-check: CreateProcess reports a missing file itself
     try:
-        creation_flags = getattr(subprocess, "CREATE_NO_WINDOW", 0) if platform.system() == "Windows" else 0
         subprocess.Popen(
             [EXE_PATH],
             shell=False,
-            creationflags=creation_flags
+            creationflags=CREATION_FLAGS
         )
         messagebox.showinfo("Launched", "Lockdown process started.")
         root.destroy()
+    except FileNotFoundError:
+        lock_btn.config(state=tk.NORMAL)
+        messagebox.showerror("Error", f"File not found:\n{EXE_PATH}")
     except Exception as e:
         lock_btn.config(state=tk.NORMAL)
         messagebox.showerror("Error", f"Cannot start:\n{EXE_PATH}\n\n{e}")
@@ -1,19 +1,46 @@
+import io
 import json
 import logging
+import mmap
+import os
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 import platform
+import queue
+import re
+import sys
 from pathlib import Path
+import shutil
 import tempfile
 import csv
-import chardet
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 
 # Configure logging
-tlogging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s: %(message)s')
+logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s: %(message)s')
 
 # History file for storing recent keywords
 HISTORY_FILE = Path.home() / ".text_search_keywords.json"
+_history_lock = threading.Lock()  # background saves must not interleave
+_history_seq = 0  # newest snapshot queued by save_history_async
+
+# Inverse of str.lower() for case-insensitive patterns; scan workers share one build
+_lower_sources = None
+_lower_sources_lock = threading.Lock()
+
+# Files smaller than this are read() outright; mapping them costs more than it saves
+MMAP_MIN_SIZE = 4096
+# Largest piece of a mapped file copied at once when counting or lowercasing it
+MMAP_SLICE = 16 * 1024 * 1024
+# File reads release the GIL, so more workers than cores keeps the disk queue busy
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+# Walked-but-unscanned paths kept in memory while the walk runs ahead
+FILE_QUEUE_SIZE = 1000
+SEARCH_EXTENSIONS = ('.txt', '.log', '.csv', '.json', '.xml')
+# Rows kept for the on-screen preview; the CSV always gets every match
+PREVIEW_LIMIT = 1000
 
 
 def safe_path(path: Path) -> str:
@@ -46,36 +73,381 @@ def load_history() -> list:
     return []
 
 
-def save_history(history: list):
+def save_history(history: list, seq: int = None):
     """
-    Save keyword history to JSON.
+    Save keyword history to JSON. A snapshot from save_history_async (seq) is
+    dropped once a newer one is queued, so an older save can't land last.
     """
     try:
-        HISTORY_FILE.write_text(
-            json.dumps(history, ensure_ascii=False, indent=2),
-            encoding='utf-8'
-        )
+        with _history_lock:
+            if seq is not None and seq != _history_seq:
+                return
+            HISTORY_FILE.write_text(
+                json.dumps(history, ensure_ascii=False, indent=2),
+                encoding='utf-8'
+            )
     except Exception as e:
         logging.error("Failed to save history: %s", e)
 
 
-def detect_encoding(file_path: Path, cache: dict, sample_size=8192) -> str:
+def save_history_async(history: list):
+    """
+    Save a snapshot of the history on a background thread so a slow home
+    directory (e.g. a network drive) doesn't stall the Search click.
+    """
+    global _history_seq
+    with _history_lock:
+        _history_seq += 1
+        seq = _history_seq
+    threading.Thread(target=save_history, args=(list(history), seq)).start()
+
+
+def sniff_encoding(head: bytes) -> str:
+    """
+    Pick the encoding from a byte-order mark; anything without one is read as UTF-8.
+    """
+    if head.startswith((b'\xff\xfe\x00\x00', b'\x00\x00\xfe\xff')):
+        return 'utf-32'
+    if head.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'utf-16'
+    if head.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    return 'utf-8'
+
+
+def encode_needle(keyword: str, encoding: str):
     """
-    Detect encoding using chardet and cache by file extension.
+    Encode keyword for a raw byte scan, or return None if files in this
+    encoding can't be scanned as bytes (e.g. UTF-16, where '\\n' is two bytes).
     """
-    ext = file_path.suffix.lower()
-    if ext in cache:
-        return cache[ext]
+    if encoding == 'utf-8-sig':
+        encoding = 'utf-8'  # the BOM only precedes line 1; encoding would prepend it to the needle
     try:
-        with open(file_path, 'rb') as f:
-            raw = f.read(sample_size)
-        result = chardet.detect(raw)
-        encoding = result.get('encoding') or 'utf-8'
-    except Exception as e:
-        logging.warning("Encoding detection failed for %s: %s", file_path, e)
-        encoding = 'utf-8'
-    cache[ext] = encoding
-    return encoding
+        if '\n'.encode(encoding) != b'\n':
+            return None
+        return keyword.encode(encoding)
+    except (LookupError, UnicodeEncodeError):
+        return None
+
+
+def lower_sources() -> tuple:
+    """
+    Invert str.lower() for the characters it changes: a dict from a lowercase
+    character to the others that lower to it ('k' -> 'KK'), plus the pairs whose
+    lowercase is longer than one character ('İ' -> 'i̇'). Every other character
+    lowers to itself. Built once, on first use.
+    """
+    global _lower_sources
+    with _lower_sources_lock:
+        if _lower_sources is None:
+            sources, multi = {}, []
+            # Most 256-character blocks (CJK, symbols, ...) have no case at all
+            for base in range(0, sys.maxunicode + 1, 256):
+                block = ''.join(map(chr, range(base, base + 256)))
+                if block.lower() == block:
+                    continue
+                for c in block:
+                    low = c.lower()
+                    if low == c:
+                        continue
+                    if len(low) == 1:
+                        sources[low] = sources.get(low, '') + c
+                    else:
+                        multi.append((c, low))
+            _lower_sources = sources, tuple(multi)
+    return _lower_sources
+
+
+def contains(buf, sub: bytes) -> bool:
+    """
+    sub in buf, trying its first byte alone first: a one-byte find is a memchr,
+    so the common miss costs far less than a full multi-byte search.
+    """
+    return buf.find(sub[:1]) != -1 and buf.find(sub) != -1
+
+
+@lru_cache(maxsize=64)
+def ascii_lowering_chars(folded: bytes) -> str:
+    """
+    The non-ASCII characters whose lowercase overlaps the ASCII keyword folded;
+    bytes.lower() can't see them, so a file holding any needs caseless_pattern.
+    """
+    sources, multi = lower_sources()
+    key = folded.decode('ascii')
+    return ''.join([c for k in set(key) for c in sources.get(k, '') if not c.isascii()]
+                   + [c for c, m in multi if any(k in m for k in key)])
+
+
+@lru_cache(maxsize=64)  # called per file with the same keyword
+def caseless_pattern(keyword: str, encoding: str = None):
+    """
+    Compile a pattern matching where keyword.lower() in line.lower() would,
+    without lowering the text: each position accepts every character that lowers
+    to the keyword's. Context-dependent lowering is not reproduced (a word-final
+    'Σ' lowers to 'ς', but here matches as 'σ'). Without an encoding the pattern
+    is for str; with one it is for raw bytes, or None under the same conditions
+    as encode_needle.
+    """
+    if encoding is None:
+        quote, syntax = re.escape, ('', '(?:', '|', ')')
+    elif encode_needle(keyword, encoding) is None:
+        return None
+    else:
+        quote, syntax = (lambda c: re.escape(encode_needle(c, encoding))), (b'', b'(?:', b'|', b')')
+    empty, open_, bar, close = syntax
+    low = keyword.lower()
+    sources, multi = lower_sources()
+
+    def group(alts):
+        return alts[0] if len(alts) == 1 else open_ + bar.join(sorted(alts)) + close
+
+    @lru_cache(maxsize=None)
+    def from_pos(i):
+        if i == len(low):
+            return empty
+        # Alternatives keyed by how many characters of low they cover
+        by_len = {1: [quote(c) for c in low[i] + sources.get(low[i], '')]}
+        for c, m in multi:
+            # Any tail of a multi-character lowering may start the match; later ones must align
+            for j in range(len(m) if i == 0 else 1):
+                seg = m[j:]
+                if low.startswith(seg, i) or seg.startswith(low[i:]):
+                    by_len.setdefault(min(len(seg), len(low) - i), []).append(quote(c))
+        return group([group(alts) + from_pos(i + n) for n, alts in by_len.items()])
+
+    return re.compile(from_pos(0))
+
+
+def count_in(buf, sub, start: int, end: int) -> int:
+    """
+    buf.count(sub, start, end), also for an mmap (which has no count()): that is
+    counted in bounded slices so a multi-GB span is never copied at once.
+    sub must be a single byte or character.
+    """
+    if not isinstance(buf, mmap.mmap):
+        return buf.count(sub, start, end)
+    if end - start <= MMAP_SLICE:
+        return buf[start:end].count(sub)  # the usual gap between two matches
+    return sum(buf[i:min(i + MMAP_SLICE, end)].count(sub) for i in range(start, end, MMAP_SLICE))
+
+
+class FoldedNeedle:
+    """
+    An ASCII-lowercase needle searched in a mapped file as if the file were
+    lowercased too. Only one MMAP_SLICE window is lowered at a time (windows
+    overlap by len(needle) - 1), so each scan holds a bounded copy, not the file.
+    """
+
+    def __init__(self, buf, needle: bytes):
+        self.buf, self.needle = buf, needle
+        self.base, self.window = 0, b''  # window is buf[base:base + len(window)].lower()
+
+    def find(self, start: int) -> int:
+        n, size = len(self.needle), len(self.buf)
+        while start + n <= size:
+            # Reuse the current window while it still holds a needle's length from start
+            if not (self.base <= start and start + n <= self.base + len(self.window)):
+                self.base, self.window = start, self.buf[start:start + MMAP_SLICE].lower()
+            pos = self.window.find(self.needle, start - self.base)
+            if pos != -1:
+                return self.base + pos
+            start = self.base + len(self.window) - n + 1
+        return -1
+
+    def rfind(self) -> int:
+        n, end = len(self.needle), len(self.buf)
+        while end >= n:
+            self.base = max(end - MMAP_SLICE, 0)
+            self.window = self.buf[self.base:end].lower()
+            pos = self.window.rfind(self.needle)
+            if pos != -1:
+                return self.base + pos
+            end = self.base + n - 1
+        return -1
+
+
+def iter_matches(buf, needle, newline):
+    """
+    Yield (lineno, start, end) for each line of buf containing needle.
+    buf may be bytes, an mmap or str, and needle a literal, a compiled pattern
+    or a FoldedNeedle over buf; line numbers are counted incrementally.
+    """
+    if isinstance(needle, re.Pattern):
+        search = needle.search
+
+        def find(start):
+            m = search(buf, start)
+            return m.start() if m else -1
+    elif isinstance(needle, FoldedNeedle):
+        find = needle.find
+    else:
+        find = partial(buf.find, needle)
+    lineno, last = 1, 0
+    pos = find(0)
+    while pos != -1:
+        start = buf.rfind(newline, 0, pos) + 1
+        end = buf.find(newline, pos)
+        if end == -1:
+            end = len(buf)
+        lineno += count_in(buf, newline, last, start)
+        last = start
+        yield lineno, start, end
+        pos = find(end)
+
+
+def last_match(buf, needle, newline):
+    """
+    Return (lineno, start, end) of the last line of buf containing needle, or None.
+    Searches backwards from the end instead of visiting every earlier hit.
+    """
+    if isinstance(needle, re.Pattern):
+        # no reverse regex search; keep the last forward match
+        found = None
+        for found in iter_matches(buf, needle, newline):
+            pass
+        return found
+    pos = needle.rfind() if isinstance(needle, FoldedNeedle) else buf.rfind(needle)
+    if pos == -1:
+        return None
+    start = buf.rfind(newline, 0, pos) + 1
+    end = buf.find(newline, pos)
+    if end == -1:
+        end = len(buf)
+    return count_in(buf, newline, 0, start) + 1, start, end
+
+
+def find_lines(hay, needle, newline, match_once: bool, use_last_match: bool) -> list:
+    """
+    Return (lineno, start, end) for the matching lines the match options ask for.
+    """
+    if use_last_match:
+        found = last_match(hay, needle, newline)
+        return [found] if found else []
+    matches = iter_matches(hay, needle, newline)
+    if match_once:
+        first = next(matches, None)
+        return [first] if first else []
+    return list(matches)
+
+
+def scan_file(path: Path, keyword: str, case_sensitive: bool, match_once: bool,
+              use_last_match: bool) -> list:
+    """
+    Return [(lineno, line)] for the lines of one file containing keyword.
+    Runs on a worker thread; read errors propagate to the caller.
+    """
+    with open(safe_path(path), 'rb') as f:
+        enc = sniff_encoding(f.read(4))
+        f.seek(0)
+        if case_sensitive:
+            needle = encode_needle(keyword, enc)
+        else:
+            needle = caseless_pattern(keyword, enc)
+            # ASCII keywords scan a lowered copy instead, unless the file may hold one of the
+            # non-ASCII characters that lower() into the keyword (KELVIN SIGN -> 'k')
+            folded = encode_needle(keyword.lower(), enc) if keyword.isascii() else None
+        if needle is not None:
+            # Scan the raw bytes; only matching lines are decoded
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+                buf = f.read()
+            else:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                hay = buf
+                if not case_sensitive and folded is not None and not any(
+                        contains(buf, encode_needle(c, enc)) for c in ascii_lowering_chars(folded)):
+                    # Cheap reject before lowering: any match has the needle's first byte in some case
+                    first = folded[:1]
+                    if buf.find(first) == -1 and buf.find(first.upper()) == -1:
+                        return []
+                    # A small file is lowercased whole; a mapped one a window at a time
+                    if isinstance(buf, mmap.mmap):
+                        needle = FoldedNeedle(buf, folded)
+                    else:
+                        needle, hay = folded, buf.lower()
+                return [(lineno, buf[start:end].decode(enc, 'ignore').strip())
+                        for lineno, start, end in find_lines(hay, needle, b'\n', match_once, use_last_match)]
+            finally:
+                if isinstance(buf, mmap.mmap):
+                    buf.close()
+
+        # Text fallback for UTF-16/32 only: decode once, then the same scan
+        text = io.TextIOWrapper(f, encoding=enc, errors='ignore').read()
+    needle = keyword if case_sensitive else caseless_pattern(keyword)
+    return [(lineno, text[start:end].strip())
+            for lineno, start, end in find_lines(text, needle, '\n', match_once, use_last_match)]
+
+
+def walk_files(folder: Path):
+    """
+    Yield searchable files under folder in os.walk order, straight from scandir
+    entries so no extra stat or list building is needed per directory.
+    """
+    stack = [str(folder)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                subdirs = []
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.lower().endswith(SEARCH_EXTENSIONS):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def queue_put(q: queue.Queue, item, stop_flag: threading.Event) -> bool:
+    """
+    Put item on a bounded queue, giving up if stop_flag is set while it is full.
+    """
+    while not stop_flag.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def drain_queue(q: queue.Queue, stop_flag: threading.Event):
+    """
+    Yield items from q until the producer's None sentinel or a cancel.
+    """
+    while not stop_flag.is_set():
+        try:
+            item = q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if item is None:
+            return
+        yield item
+
+
+def prefetch_scans(paths, scan, workers):
+    """
+    Scan files on a thread pool, keeping a bounded window in flight so open/read
+    latency overlaps across files. Yields (path, future) in the original order.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        try:
+            for path in paths:
+                pending.append((path, pool.submit(scan, path)))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+        finally:
+            # Closed early (cancel): drop queued scans instead of waiting on them
+            for _, future in pending:
+                future.cancel()
 
 
 class TextSearchApp:
@@ -86,7 +458,6 @@ class TextSearchApp:
 
         # Keyword history
         self.keyword_history = load_history()
-        self.encoding_cache = {}
 
         # Folder selection
         tk.Label(master, text="Folder:").grid(row=0, column=0, sticky='w', padx=5, pady=5)
@@ -154,6 +525,8 @@ class TextSearchApp:
 
         self.stop_flag = threading.Event()
         self.temp_csv_path = None
+        self.total_files = None
+        self.progress_determinate = True
 
     def on_match_once_toggled(self):
         # Disable conflicting option
@@ -180,6 +553,33 @@ class TextSearchApp:
     def update_progress(self, value: int):
         self.master.after(0, self.progress.config, {'value': value})
 
+    def update_scan_progress(self, scanned: int):
+        # Tk thread only; the bar stays indeterminate until the walk has counted every file
+        total = self.total_files
+        if total is None:
+            self.status_label.config(text=f"Scanning: {scanned} files (listing folder...)")
+            return
+        # ttk's cget('mode') is a Tcl_Obj, never equal to a str, so track the mode here
+        if not self.progress_determinate:
+            self.progress.stop()
+            self.progress.config(mode='determinate', maximum=total)
+            self.progress_determinate = True
+        self.progress.config(value=scanned)
+        self.status_label.config(text=f"Scanning: {scanned}/{total} files")
+
+    def enumerate_files(self, folder: Path, file_queue: queue.Queue):
+        """
+        Walk folder on a background thread and feed matching files to file_queue,
+        so scanning starts before the walk finishes.
+        """
+        count = 0
+        for path in walk_files(folder):
+            if not queue_put(file_queue, path, self.stop_flag):
+                return
+            count += 1
+        self.total_files = count
+        queue_put(file_queue, None, self.stop_flag)
+
     def browse_folder(self):
         folder = filedialog.askdirectory()
         if folder:
@@ -193,7 +593,7 @@ class TextSearchApp:
             self.keyword_history.insert(0, keyword)
             self.keyword_history = self.keyword_history[:20]
             self.keyword_entry['values'] = self.keyword_history
-            save_history(self.keyword_history)
+            save_history_async(self.keyword_history)
 
         # Reset flags and UI
         self.stop_flag.clear()
@@ -234,68 +634,67 @@ class TextSearchApp:
             self.reset_ui()
             return
 
-        keyword_cmp = keyword if case_sensitive else keyword.lower()
-
-        # Gather files
-        file_list = [
-            Path(root) / file
-            for root, _, files in os.walk(folder)
-            for file in files
-            if file.lower().endswith(('.txt', '.log', '.csv', '.json', '.xml'))
-        ]
-
-        total = len(file_list)
-        self.master.after(0, self.progress.config, {'maximum': total})
+        # Walk and scan concurrently; the total is known once the walker finishes
+        self.total_files = None
+        self.progress_determinate = False
+        file_queue = queue.Queue(maxsize=FILE_QUEUE_SIZE)
+        self.master.after(0, self.progress.config, {'mode': 'indeterminate'})
+        self.master.after(0, self.progress.start, 10)
+        threading.Thread(target=self.enumerate_files, args=(folder, file_queue), daemon=True).start()
 
         # Prepare CSV
         temp = tempfile.NamedTemporaryFile(
-            delete=False, suffix=".csv", mode='w', encoding='utf-8', newline=''
+            delete=False, suffix=".csv", mode='w', encoding='utf-8', newline='',
+            buffering=1024 * 1024
         )
         self.temp_csv_path = Path(temp.name)
         writer = csv.writer(temp)
         writer.writerow(["Filename", "Line Number", "Line"])
 
-        preview, count = [], 0
-        for idx, path in enumerate(file_list, start=1):
-            if self.stop_flag.is_set():
+        preview, count, errors = [], 0, []
+        scan = partial(scan_file, keyword=keyword, case_sensitive=case_sensitive, match_once=match_once,
+                       use_last_match=use_last_match)
+        # Per-file loop: bind the bound methods it calls to locals once
+        is_stopped = self.stop_flag.is_set
+        write_rows = writer.writerows
+        add_preview = preview.extend
+        after = self.master.after
+        scanned = 0
+        results = prefetch_scans(drain_queue(file_queue, self.stop_flag), scan, SCAN_WORKERS)
+        for scanned, (path, future) in enumerate(results, start=1):
+            if is_stopped():
                 self.update_status("Status: Search cancelled.")
                 break
 
             fname = path.name
             try:
-                enc = detect_encoding(path, self.encoding_cache)
-                with open(safe_path(path), 'r', encoding=enc, errors='ignore', buffering=64*1024) as f:
-                    last = None
-                    for lineno, line in enumerate(f, 1):
-                        txt = line if case_sensitive else line.lower()
-                        if keyword_cmp in txt:
-                            if match_once:
-                                count += 1
-                                writer.writerow([fname, lineno, line.strip()])
-                                preview.append((fname, lineno, line.strip()))
-                                break
-                            if use_last_match:
-                                last = (lineno, line.strip())
-                            else:
-                                count += 1
-                                writer.writerow([fname, lineno, line.strip()])
-                                preview.append((fname, lineno, line.strip()))
-                    if use_last_match and last:
-                        count += 1
-                        writer.writerow([fname, last[0], last[1]])
-                        preview.append((fname, last[0], last[1]))
+                rows = [(fname, lineno, text) for lineno, text in future.result()]
+                if rows:
+                    count += len(rows)
+                    write_rows(rows)
+                    if len(preview) < PREVIEW_LIMIT:
+                        add_preview(rows[:PREVIEW_LIMIT - len(preview)])
             except (IOError, UnicodeDecodeError) as e:
-                logging.warning("Error reading %s: %s", path, e)
+                errors.append((path, e))
                 writer.writerow([fname, 0, f"[Error: {e}]"])
-                preview.append((fname, 0, f"[Error: {e}]") )
-
-            if idx % 10 == 0 or idx == total:
-                self.update_progress(idx)
-                self.update_status(f"Scanning: {idx}/{total} files")
+                if len(preview) < PREVIEW_LIMIT:
+                    preview.append((fname, 0, f"[Error: {e}]"))
+
+            if scanned % 10 == 0:
+                after(0, self.update_scan_progress, scanned)
+        results.close()
+        if errors:
+            # One summary line instead of a log call per unreadable file
+            logging.warning("%d file(s) could not be read", len(errors))
+            for path, e in errors:
+                logging.debug("Error reading %s: %s", path, e)
 
         temp.close()
+        self.master.after(0, self.progress.stop)
+        self.master.after(0, self.progress.config,
+                          {'mode': 'determinate', 'maximum': max(scanned, 1), 'value': scanned})
         if not self.stop_flag.is_set():
-            self.update_status(f"Completed: {count} matches in {total} files")
+            self.update_status(f"Completed: {count} matches in {scanned} files")
 
         # Show preview and enable exports
         self.show_preview(preview, count)
@@ -305,7 +704,7 @@ class TextSearchApp:
 
     def show_preview(self, preview, total):
         self.result_area.delete(1.0, tk.END)
-        for fname, lineno, text in preview[:1000]:
+        for fname, lineno, text in preview:
             self.result_area.insert(
                 tk.END,
                 f"{fname} (Line {lineno}): {text}\n"
@@ -331,9 +730,7 @@ class TextSearchApp:
         )
         if dest:
             try:
-                self.temp_csv_path.write_bytes(
-                    Path(self.temp_csv_path).read_bytes()
-                )
+                shutil.copyfile(self.temp_csv_path, dest)
                 messagebox.showinfo("Success", f"Exported results to {dest}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to write CSV:\n{e}")
@@ -349,18 +746,25 @@ class TextSearchApp:
         if dest:
             try:
                 import openpyxl
+                from openpyxl.cell import WriteOnlyCell
                 from openpyxl.styles import Font
 
-                wb = openpyxl.Workbook()
-                ws = wb.active
-                ws.title = "Search Results"
+                # Write-only mode streams rows out instead of keeping a Cell object per value
+                wb = openpyxl.Workbook(write_only=True)
+                ws = wb.create_sheet("Search Results")
                 with open(self.temp_csv_path, 'r', encoding='utf-8') as f:
                     reader = csv.reader(f)
-                    for r, row in enumerate(reader, 1):
-                        for c, v in enumerate(row, 1):
-                            cell = ws.cell(row=r, column=c, value=v)
-                            if r == 1:
-                                cell.font = Font(bold=True)
+                    header = next(reader, None)
+                    if header:
+                        bold = Font(bold=True)
+                        cells = []
+                        for v in header:
+                            cell = WriteOnlyCell(ws, value=v)
+                            cell.font = bold
+                            cells.append(cell)
+                        ws.append(cells)
+                    for row in reader:
+                        ws.append(row)
                 wb.save(dest)
                 messagebox.showinfo("Success", f"Exported results to {dest}")
             except Exception as e: